@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 import logging
+from operator import attrgetter
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -39,11 +40,16 @@ from . import const
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+def _identity(data):
+    """Return data unchanged, the default value transform of a description."""
+    return data
+
+
+@dataclass(slots=True)
 class NetgearSensorEntityDescription(SensorEntityDescription):
     """Class describing Netgear sensor entities."""
 
-    value: Callable = lambda data: data
+    value: Callable = _identity
     index: int = 0
 
 
@@ -85,20 +91,22 @@ class NetgearRouterSensorEntity(NetgearAPICoordinatorEntity, RestoreSensor):
         """Initialize a Netgear device."""
         super().__init__(coordinator, switch)
         self.entity_description = entity_description
-        self._name = f"{switch.device_name} {entity_description.name}"
-        self._unique_id = (
-            f"{switch.unique_id}-{entity_description.key}-{entity_description.index}"
+        self._key = entity_description.key
+        self._name = " ".join((switch.device_name, entity_description.name))
+        self._unique_id = "-".join(
+            (switch.unique_id, self._key, str(entity_description.index))
         )
         self._value: StateType | date | datetime | Decimal = None
-        self.async_update_device()
+        self._missing_logged = False
+        # Skip the call in async_update_device for the default identity transform
+        self._value_fn: Callable | None = (
+            None if entity_description.value is _identity else entity_description.value
+        )
 
     def __repr__(self):
         return f"<NetgearNetgearRouterSensorEntity unique_id={self._unique_id}>"
-    
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        return self._value
+
+    native_value = property(attrgetter("_value"), doc="Return the state of the sensor.")
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
@@ -107,24 +115,27 @@ class NetgearRouterSensorEntity(NetgearAPICoordinatorEntity, RestoreSensor):
             sensor_data = await self.async_get_last_sensor_data()
             if sensor_data is not None:
                 self._value = sensor_data.native_value
+        else:
+            self.async_update_device()
 
     @callback
     def async_update_device(self) -> None:
         """Update the Netgear device."""
-        if self.coordinator.data is None:
+        coordinator_data = self.coordinator.data
+        if coordinator_data is None:
             return
 
-        data = self.coordinator.data.get(self.entity_description.key)
+        data = coordinator_data.get(self._key)
         if data is None:
             self._value = None
-            _LOGGER.debug(
-                "key '%s' not in Netgear router response '%s'",
-                self.entity_description.key,
-                data,
-            )
+            # A missing key usually stays missing, only log it once
+            if not self._missing_logged:
+                self._missing_logged = True
+                _LOGGER.debug("key '%s' not in Netgear router response", self._key)
             return
 
-        self._value = self.entity_description.value(data)
+        self._missing_logged = False
+        self._value = data if self._value_fn is None else self._value_fn(data)
 
 
 class NetgearRouterBinarySensorEntity(NetgearAPICoordinatorEntity, BinarySensorEntity):
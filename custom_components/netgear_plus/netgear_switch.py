@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import abstractmethod
 import asyncio
 import logging
+import sys
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -41,8 +42,10 @@ class HomeAssistantNetgearSwitch:
         self.hass = hass
         self.entry = entry
         self.entry_id = entry.entry_id
-        self.unique_id = entry.unique_id
-        self.device_name = entry.title
+        # Interned once here, every entity of this switch builds its name and
+        # unique_id from these prefixes
+        self.unique_id = sys.intern(entry.unique_id)
+        self.device_name = sys.intern(entry.title)
         self._host: str = entry.data[CONF_HOST]
         self._password = entry.data[CONF_PASSWORD]
 
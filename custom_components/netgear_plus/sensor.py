@@ -2,30 +2,20 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
+from functools import lru_cache
 import logging
 
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.components.sensor import (
-    RestoreSensor,
-    SensorDeviceClass,
-    SensorEntity,
-    SensorEntityDescription,
-    SensorStateClass,
-)
+from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    PERCENTAGE,
     UnitOfDataRate,
     UnitOfInformation,
     UnitOfTime,
     UnitOfPower,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN, KEY_COORDINATOR_SWITCH_INFOS, KEY_SWITCH
 from .netgear_entities import NetgearRouterSensorEntity, NetgearSensorEntityDescription
@@ -34,7 +24,7 @@ from .netgear_switch import HomeAssistantNetgearSwitch
 _LOGGER = logging.getLogger(__name__)
 
 
-DEVICE_SENSOR_TYPES = [
+DEVICE_SENSOR_TYPES = (
     NetgearSensorEntityDescription(
         key="switch_ip",
         name="IP Address",
@@ -83,156 +73,116 @@ DEVICE_SENSOR_TYPES = [
         device_class=SensorDeviceClass.DURATION,
         icon="mdi:clock",
     ),
-]
-
-PORT_TEMPLATE = OrderedDict(
-    {
-        "port_{port}_traffic_rx_mbytes": {
-            "name": "Port {port} Traffic Received",
-            "native_unit_of_measurement": UnitOfInformation.MEGABYTES,
-            # 'unit_of_measurement': UnitOfInformation.GIGABYTES,
-            "device_class": SensorDeviceClass.DATA_SIZE,
-            "icon": "mdi:download",
-        },
-        "port_{port}_traffic_tx_mbytes": {
-            "name": "Port {port} Traffic Transferred",
-            "native_unit_of_measurement": UnitOfInformation.MEGABYTES,
-            # 'unit_of_measurement': UnitOfInformation.GIGABYTES,
-            "device_class": SensorDeviceClass.DATA_SIZE,
-            "icon": "mdi:upload",
-        },
-        "port_{port}_speed_rx_mbytes": {
-            "name": "Port {port} Receiving",
-            "native_unit_of_measurement": UnitOfDataRate.MEGABYTES_PER_SECOND,
-            # 'unit_of_measurement': UnitOfInformation.GIGABYTES,
-            "device_class": SensorDeviceClass.DATA_RATE,
-            "icon": "mdi:download",
-        },
-        "port_{port}_speed_tx_mbytes": {
-            "name": "Port {port} Transferring",
-            "native_unit_of_measurement": UnitOfDataRate.MEGABYTES_PER_SECOND,
-            # 'unit_of_measurement': UnitOfInformation.GIGABYTES,
-            "device_class": SensorDeviceClass.DATA_RATE,
-            "icon": "mdi:upload",
-        },
-        "port_{port}_speed_io_mbytes": {
-            "name": "Port {port} IO",
-            "native_unit_of_measurement": UnitOfDataRate.MEGABYTES_PER_SECOND,
-            # 'unit_of_measurement': UnitOfInformation.GIGABYTES,
-            "device_class": SensorDeviceClass.DATA_RATE,
-            "icon": "mdi:swap-vertical",
-        },
-        "port_{port}_sum_rx_mbytes": {
-            "name": "Port {port} Total Received",
-            "native_unit_of_measurement": UnitOfInformation.MEGABYTES,
-            "unit_of_measurement": UnitOfInformation.GIGABYTES,
-            "device_class": SensorDeviceClass.DATA_SIZE,
-            "icon": "mdi:download",
-        },
-        "port_{port}_sum_tx_mbytes": {
-            "name": "Port {port} Total Transferred",
-            "native_unit_of_measurement": UnitOfInformation.MEGABYTES,
-            "unit_of_measurement": UnitOfInformation.GIGABYTES,
-            "device_class": SensorDeviceClass.DATA_SIZE,
-            "icon": "mdi:upload",
-        },
-        # "port_{port}_status": {
-        #    "name": "Port {port} Status",
-        #    # "native_unit_of_measurement": BinarySensorDeviceClass.CONNECTIVITY,
-        #    "device_class": BinarySensorDeviceClass.CONNECTIVITY,
-        #    #'icon': "mdi:upload"
-        # },
-        "port_{port}_connection_speed": {
-            "name": "Port {port} Connection Speed",
-            "native_unit_of_measurement": UnitOfDataRate.MEGABYTES_PER_SECOND,
-            "device_class": SensorDeviceClass.DATA_RATE,
-            #'icon': "mdi:upload"
-        },
-    }
 )
 
-POE_STATUS_TEMPLATE = OrderedDict(
-    {
-        "port_{port}_poe_output_power": {
-            "name": "Port {port} PoE Output Power",
-            "native_unit_of_measurement": UnitOfPower.WATT,
-            "device_class": SensorDeviceClass.POWER,
-            "icon": "mdi:flash",
-        },
-    }
+# (native_unit_of_measurement, unit_of_measurement, device_class) shared by the
+# port sensors, referenced by index from _PORT_SPEC
+_KINDS = (
+    (UnitOfInformation.MEGABYTES, None, SensorDeviceClass.DATA_SIZE),
+    (UnitOfDataRate.MEGABYTES_PER_SECOND, None, SensorDeviceClass.DATA_RATE),
+    (
+        UnitOfInformation.MEGABYTES,
+        UnitOfInformation.GIGABYTES,
+        SensorDeviceClass.DATA_SIZE,
+    ),
 )
 
-AGGREGATED_SENSORS = OrderedDict(
-    {
-        "sum_port_speed_bps_io": {
-            "name": "Switch IO",
-            "native_unit_of_measurement": UnitOfDataRate.MEGABYTES_PER_SECOND,
-            "device_class": SensorDeviceClass.DATA_RATE,
-            #'icon': "mdi:upload"
-        },
-        "sum_port_traffic_rx": {
-            "name": "Switch Traffic Received",
-            "native_unit_of_measurement": UnitOfInformation.MEGABYTES,
-            "device_class": SensorDeviceClass.DATA_SIZE,
-            "icon": "mdi:download",
-        },
-        "sum_port_traffic_tx": {
-            "name": "Switch Traffic Transferred",
-            "native_unit_of_measurement": UnitOfInformation.MEGABYTES,
-            "device_class": SensorDeviceClass.DATA_SIZE,
-            "icon": "mdi:upload",
-        },
-    }
+# (kind index, icon, key template, name template) for every sensor of a port
+_PORT_SPEC = (
+    (0, "mdi:download", "port_{port}_traffic_rx_mbytes", "Port {port} Traffic Received"),
+    (0, "mdi:upload", "port_{port}_traffic_tx_mbytes", "Port {port} Traffic Transferred"),
+    (1, "mdi:download", "port_{port}_speed_rx_mbytes", "Port {port} Receiving"),
+    (1, "mdi:upload", "port_{port}_speed_tx_mbytes", "Port {port} Transferring"),
+    (1, "mdi:swap-vertical", "port_{port}_speed_io_mbytes", "Port {port} IO"),
+    (2, "mdi:download", "port_{port}_sum_rx_mbytes", "Port {port} Total Received"),
+    (2, "mdi:upload", "port_{port}_sum_tx_mbytes", "Port {port} Total Transferred"),
+    (1, None, "port_{port}_connection_speed", "Port {port} Connection Speed"),
 )
 
+POE_STATUS_TEMPLATE = {
+    "port_{port}_poe_output_power": {
+        "name": "Port {port} PoE Output Power",
+        "native_unit_of_measurement": UnitOfPower.WATT,
+        "device_class": SensorDeviceClass.POWER,
+        "icon": "mdi:flash",
+    },
+}
+
+AGGREGATED_SENSORS = {
+    "sum_port_speed_bps_io": {
+        "name": "Switch IO",
+        "native_unit_of_measurement": UnitOfDataRate.MEGABYTES_PER_SECOND,
+        "device_class": SensorDeviceClass.DATA_RATE,
+        #'icon': "mdi:upload"
+    },
+    "sum_port_traffic_rx": {
+        "name": "Switch Traffic Received",
+        "native_unit_of_measurement": UnitOfInformation.MEGABYTES,
+        "device_class": SensorDeviceClass.DATA_SIZE,
+        "icon": "mdi:download",
+    },
+    "sum_port_traffic_tx": {
+        "name": "Switch Traffic Transferred",
+        "native_unit_of_measurement": UnitOfInformation.MEGABYTES,
+        "device_class": SensorDeviceClass.DATA_SIZE,
+        "icon": "mdi:upload",
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _port_descriptions(ports_cnt: int) -> tuple[NetgearSensorEntityDescription, ...]:
+    """Build the port sensor descriptions for a switch with ports_cnt ports."""
+    return tuple(
+        NetgearSensorEntityDescription(
+            key=key_template.format(port=port_nr),
+            name=name_template.format(port=port_nr),
+            native_unit_of_measurement=_KINDS[kind][0],
+            unit_of_measurement=_KINDS[kind][1],
+            device_class=_KINDS[kind][2],
+            icon=icon,
+        )
+        for port_nr in range(1, ports_cnt + 1)
+        for kind, icon, key_template, name_template in _PORT_SPEC
+    )
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up device tracker for Netgear component."""
-    gs_switch: HomeAssistantNetgearSwitch = hass.data[DOMAIN][entry.entry_id][
-        KEY_SWITCH
-    ]
-    coordinator_switch_infos = hass.data[DOMAIN][entry.entry_id][
-        KEY_COORDINATOR_SWITCH_INFOS
-    ]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    gs_switch: HomeAssistantNetgearSwitch = entry_data[KEY_SWITCH]
+    coordinator_switch_infos = entry_data[KEY_COORDINATOR_SWITCH_INFOS]
 
     # Router entities
-    switch_entities = []
+    switch_entities: list[NetgearRouterSensorEntity] = []
 
-    for description in DEVICE_SENSOR_TYPES:
-        descr_entity = NetgearRouterSensorEntity(
+    switch_entities.extend(
+        NetgearRouterSensorEntity(
             coordinator=coordinator_switch_infos,
             switch=gs_switch,
             entity_description=description,
         )
-        switch_entities.append(descr_entity)
+        for description in DEVICE_SENSOR_TYPES
+    )
 
     ports_cnt = gs_switch.api.ports
     _LOGGER.info(
         f"[sensor.async_setup_entry] setting up Platform.SENSOR for {ports_cnt} Switch Ports"
     )
 
-    entity_descriptions_kwargs = []
-
     # Adding port sensors
-    for i in range(ports_cnt):
-        port_nr = i + 1
-        for port_sensor_key, port_sensor_data in PORT_TEMPLATE.items():
-            entity_descriptions_kwargs.append(
-                {
-                    "key": port_sensor_key.format(port=port_nr),
-                    "name": port_sensor_data["name"].format(port=port_nr),
-                    "native_unit_of_measurement": port_sensor_data.get(
-                        "native_unit_of_measurement", None
-                    ),
-                    "unit_of_measurement": port_sensor_data.get(
-                        "unit_of_measurement", None
-                    ),
-                    "device_class": port_sensor_data["device_class"],
-                    "icon": port_sensor_data.get("icon"),
-                }
-            )
+    switch_entities.extend(
+        NetgearRouterSensorEntity(
+            coordinator=coordinator_switch_infos,
+            switch=gs_switch,
+            entity_description=description,
+        )
+        for description in _port_descriptions(ports_cnt)
+    )
+
+    entity_descriptions_kwargs = []
 
     # Adding port sensors for poe status
     if gs_switch.api.poe_ports and len(gs_switch.api.poe_ports) > 0:
@@ -266,16 +216,14 @@ async def async_setup_entry(
                 "icon": sensor_data.get("icon"),
             }
         )
-    
-    for description_kwargs in entity_descriptions_kwargs:
-        description = NetgearSensorEntityDescription(**description_kwargs)
-        port_sensor_entity = NetgearRouterSensorEntity(
+
+    switch_entities.extend(
+        NetgearRouterSensorEntity(
             coordinator=coordinator_switch_infos,
             switch=gs_switch,
-            entity_description=description,
+            entity_description=NetgearSensorEntityDescription(**description_kwargs),
         )
-        switch_entities.append(port_sensor_entity)
+        for description_kwargs in entity_descriptions_kwargs
+    )
 
     async_add_entities(switch_entities)
-    # commented next line, why was it there???
-    # coordinator_switch_infos.data = True